@@ -1,10 +1,11 @@
 import cv2
 import mediapipe as mp
 import requests
-import time
 import threading
 import os
 
+from finger_state import FINGERS, FingerStateClassifier
+
 # Suppress TensorFlow warnings
 os.environ["TF_CPP_MIN_LOG_LEVEL"] = "2"
 
@@ -13,8 +14,6 @@ os.environ["TF_CPP_MIN_LOG_LEVEL"] = "2"
 # ========================
 ESP32_IP = "http://10.150.17.152"  # ← Replace with your ESP32 IP
 BASE_URL = f"{ESP32_IP}/led"       # Base URL for LED control
-r = requests.get(ESP32_IP)
-print(r.text)
 
 # ========================
 # MediaPipe Hands Setup
@@ -22,13 +21,7 @@ print(r.text)
 mp_hands = mp.solutions.hands
 hands = mp_hands.Hands(max_num_hands=1, min_detection_confidence=0.7)
 mp_drawing = mp.solutions.drawing_utils
-
-# ========================
-# Global Variables
-# ========================
-last_state = [False, False, False, False, False]
-last_send_time = 0
-SEND_INTERVAL = 0.3  # Minimum time between commands (seconds)
+PROCESS_SIZE = (320, 240)  # Frame size (width, height) used for hand detection
 
 # ========================
 # Function to send LED command asynchronously
@@ -43,43 +36,25 @@ def send_led_command(endpoint):
             print(f"Failed to send command: {endpoint}, Error: {e}")
     threading.Thread(target=task).start()
 
+finger_classifier = FingerStateClassifier(aspect=PROCESS_SIZE[0] / PROCESS_SIZE[1])
+
 # ========================
 # Function to detect finger states and send commands
 # ========================
-def count_fingers(hand_landmarks):
-    global last_state, last_send_time
-
-    # Finger state detection (up = True, down = False)
-    thumb_up = hand_landmarks.landmark[mp_hands.HandLandmark.THUMB_TIP].x < \
-               hand_landmarks.landmark[mp_hands.HandLandmark.THUMB_IP].x
-    index_up = hand_landmarks.landmark[mp_hands.HandLandmark.INDEX_FINGER_TIP].y < \
-               hand_landmarks.landmark[mp_hands.HandLandmark.INDEX_FINGER_PIP].y
-    middle_up = hand_landmarks.landmark[mp_hands.HandLandmark.MIDDLE_FINGER_TIP].y < \
-                hand_landmarks.landmark[mp_hands.HandLandmark.MIDDLE_FINGER_PIP].y
-    ring_up = hand_landmarks.landmark[mp_hands.HandLandmark.RING_FINGER_TIP].y < \
-              hand_landmarks.landmark[mp_hands.HandLandmark.RING_FINGER_PIP].y
-    pinky_up = hand_landmarks.landmark[mp_hands.HandLandmark.PINKY_TIP].y < \
-               hand_landmarks.landmark[mp_hands.HandLandmark.PINKY_PIP].y
-
-    finger_status = [thumb_up, index_up, middle_up, ring_up, pinky_up]
-    now = time.time()
-
-    # Send commands only if finger state changed and interval passed
-    if finger_status != last_state and (now - last_send_time) > SEND_INTERVAL:
-        send_led_command("thumb/on" if thumb_up else "thumb/off")
-        send_led_command("index/on" if index_up else "index/off")
-        send_led_command("middle/on" if middle_up else "middle/off")
-        send_led_command("ring/on" if ring_up else "ring/off")
-        send_led_command("pinky/on" if pinky_up else "pinky/off")
-        last_state = finger_status.copy()
-        last_send_time = now
-
-    return finger_status
+def count_fingers(hand_landmarks, handedness="Right"):
+    # Send commands only for fingers whose state changed
+    for i, is_up in finger_classifier.update(hand_landmarks, handedness):
+        send_led_command(f"{FINGERS[i]}/on" if is_up else f"{FINGERS[i]}/off")
+
+    return finger_classifier.state.copy()
 
 # ========================
 # Main Loop
 # ========================
 def main():
+    r = requests.get(ESP32_IP)
+    print(r.text)
+
     cap = cv2.VideoCapture(0)  # Adjust camera index if needed
 
     if not cap.isOpened():
@@ -94,16 +69,19 @@ def main():
         frame = cv2.flip(frame, 1)  # Mirror the frame
         # Resize for faster processing
         frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        frame_rgb = cv2.resize(frame_rgb, (320, 240))
+        frame_rgb = cv2.resize(frame_rgb, PROCESS_SIZE)
 
         # Detect hands
         results = hands.process(frame_rgb)
         if results.multi_hand_landmarks:
-            for hand_landmarks in results.multi_hand_landmarks:
+            for hand_landmarks, hand_info in zip(results.multi_hand_landmarks, results.multi_handedness):
                 # Draw landmarks on original frame
                 mp_drawing.draw_landmarks(frame, hand_landmarks, mp_hands.HAND_CONNECTIONS)
                 # Detect fingers and control LEDs
-                count_fingers(hand_landmarks)
+                count_fingers(hand_landmarks, hand_info.classification[0].label)
+        else:
+            # Dwell time must be spent with the hand in view
+            finger_classifier.reset_pending()
 
         # Display the frame
         cv2.imshow("Hand Gesture Recognition", frame)
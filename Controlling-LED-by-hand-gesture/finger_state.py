@@ -0,0 +1,139 @@
+import math
+import random
+import time
+from types import SimpleNamespace
+
+# ========================
+# Finger State Settings
+# ========================
+FINGERS = ["thumb", "index", "middle", "ring", "pinky"]  # Also the ESP32 endpoint names
+HYSTERESIS = 0.1   # Margin (fraction of palm length) needed to switch a finger state
+MIN_DWELL = 0.1    # A new state must hold this long before it is sent (seconds)
+ASPECT = 320 / 240  # Width / height of the frame the landmarks were detected on
+
+# MediaPipe hand landmark indices (same values as mp.solutions.hands.HandLandmark),
+# kept here so this module can be imported without MediaPipe
+WRIST = 0
+THUMB_IP, THUMB_TIP = 3, 4
+INDEX_FINGER_PIP, INDEX_FINGER_TIP = 6, 8
+MIDDLE_FINGER_MCP, MIDDLE_FINGER_PIP, MIDDLE_FINGER_TIP = 9, 10, 12
+RING_FINGER_PIP, RING_FINGER_TIP = 14, 16
+PINKY_PIP, PINKY_TIP = 18, 20
+
+# ========================
+# Finger State Classifier
+# ========================
+class FingerStateClassifier:
+    """Per-finger up/down state with hysteresis and a minimum dwell time.
+
+    Does not depend on the camera or the ESP32, so it can be replayed on
+    recorded landmark streams by passing the recorded timestamps as `now`.
+    """
+
+    # (tip, joint) pairs compared for index, middle, ring and pinky
+    FINGER_JOINTS = [
+        (INDEX_FINGER_TIP, INDEX_FINGER_PIP),
+        (MIDDLE_FINGER_TIP, MIDDLE_FINGER_PIP),
+        (RING_FINGER_TIP, RING_FINGER_PIP),
+        (PINKY_TIP, PINKY_PIP),
+    ]
+
+    def __init__(self, hysteresis=HYSTERESIS, min_dwell=MIN_DWELL, aspect=ASPECT):
+        self.hysteresis = hysteresis
+        self.min_dwell = min_dwell
+        self.aspect = aspect
+        self.state = [False] * len(FINGERS)
+        self._pending_since = [None] * len(FINGERS)
+
+    def margins(self, hand_landmarks, handedness="Right"):
+        """Signed distance of each finger past its joint, in palm lengths (> 0 = up)"""
+        lm = hand_landmarks.landmark
+        # Normalized x is a fraction of the width and y of the height; scale x so
+        # both are in frame heights and all five margins share the same units
+        wrist = lm[WRIST]
+        middle_mcp = lm[MIDDLE_FINGER_MCP]
+        palm = math.hypot((middle_mcp.x - wrist.x) * self.aspect, middle_mcp.y - wrist.y) or 1e-6
+
+        # In the mirrored frame a right thumb points left when extended, a left thumb right
+        thumb = (lm[THUMB_IP].x - lm[THUMB_TIP].x) * self.aspect / palm
+        if handedness == "Left":
+            thumb = -thumb
+
+        return [thumb] + [(lm[pip].y - lm[tip].y) / palm for tip, pip in self.FINGER_JOINTS]
+
+    def reset_pending(self):
+        """Forget unconfirmed changes (call while no hand is visible)"""
+        self._pending_since = [None] * len(FINGERS)
+
+    def update(self, hand_landmarks, handedness="Right", now=None):
+        """Feed one frame; return [(finger index, is_up)] for stable state changes only"""
+        if now is None:
+            now = time.time()
+
+        transitions = []
+        for i, margin in enumerate(self.margins(hand_landmarks, handedness)):
+            # Inside the hysteresis band the current state is kept
+            if self.state[i]:
+                reading = margin > -self.hysteresis
+            else:
+                reading = margin > self.hysteresis
+
+            if reading == self.state[i]:
+                self._pending_since[i] = None
+                continue
+            if self._pending_since[i] is None:
+                self._pending_since[i] = now
+            if now - self._pending_since[i] >= self.min_dwell:
+                self.state[i] = reading
+                self._pending_since[i] = None
+                transitions.append((i, reading))
+
+        return transitions
+
+# ========================
+# Replay
+# ========================
+def replay(stream, classifier=None):
+    """Run a recorded stream through a classifier and count the LED commands it sends.
+
+    `stream` yields (timestamp, hand_landmarks, handedness) tuples, with
+    hand_landmarks set to None for frames where no hand was detected.
+    """
+    if classifier is None:
+        classifier = FingerStateClassifier()
+
+    commands = 0
+    for now, hand_landmarks, handedness in stream:
+        if hand_landmarks is None:
+            classifier.reset_pending()
+            continue
+        commands += len(classifier.update(hand_landmarks, handedness, now))
+    return commands
+
+
+def synthetic_stream(seconds=10.0, fps=30, noise=0.01, seed=0):
+    """Right hand with the index finger held at the up/down boundary plus landmark noise,
+    then raised for real halfway through"""
+    rng = random.Random(seed)
+    frames = int(seconds * fps)
+    for n in range(frames):
+        lm = [SimpleNamespace(x=0.5, y=0.5) for _ in range(21)]
+        lm[WRIST] = SimpleNamespace(x=0.5, y=0.8)
+        lm[MIDDLE_FINGER_MCP] = SimpleNamespace(x=0.5, y=0.6)
+        lift = 0.08 if n >= frames // 2 else 0.0
+        lm[INDEX_FINGER_TIP] = SimpleNamespace(x=0.5, y=0.5 - lift + rng.gauss(0, noise))
+        yield n / fps, SimpleNamespace(landmark=lm), "Right"
+
+
+if __name__ == "__main__":
+    # Old behaviour: strict comparisons, all five commands per change, SEND_INTERVAL throttle
+    strict = FingerStateClassifier(hysteresis=0.0, min_dwell=0.0)
+    last_state, last_send_time, strict_commands = list(strict.state), -1.0, 0
+    for now, hand_landmarks, handedness in synthetic_stream():
+        state = [margin > 0 for margin in strict.margins(hand_landmarks, handedness)]
+        if state != last_state and now - last_send_time > 0.3:
+            strict_commands += len(FINGERS)
+            last_state, last_send_time = state, now
+
+    print(f"Strict comparisons: {strict_commands} commands")
+    print(f"Hysteresis classifier: {replay(synthetic_stream())} commands")
@@ -3,6 +3,10 @@ import cv2
 import os
 import numpy as np
 import tempfile
+import multiprocessing
+import queue
+
+from frame_ring import FrameRing, capture_frames, check_workers, consume_latest
 
 try:
     from pptx import Presentation as PptxPresentation
@@ -30,24 +34,12 @@ cam_width, cam_height = 1280, 720
 # Webcam display window size (small window)
 cam_display_width, cam_display_height = 320, 240
 
-# Slide display - use fullscreen or screen resolution
-try:
-    # Try to get screen resolution
-    root = tk.Tk()
-    screen_width = root.winfo_screenwidth()
-    screen_height = root.winfo_screenheight()
-    root.destroy()
-    slide_width = screen_width
-    slide_height = screen_height
-except:
-    # Fallback to full HD
-    slide_width = 1920
-    slide_height = 1080
-
-default_slide_window_width = min(slide_width, 1280)
-default_slide_window_height = min(slide_height, 720)
-
 gestureThreshold = 300                     # Height threshold for gesture detection
+# Run webcam capture and hand tracking in separate processes that share frames
+# through a shared memory ring, leaving this process free for slide rendering
+use_multiprocess = False
+ring_slots = 8
+idle_refresh_interval = 0.1  # Seconds without tracking results before the windows are repainted anyway
 folderPath = "Presentation"                # Folder with slides (images/PPT/PDF)
 if not os.path.isdir(folderPath):
     os.makedirs(folderPath, exist_ok=True)
@@ -260,261 +252,394 @@ def select_file():
             print("File not found. Please try again with a valid file name or index.")
 
 # ==========================
-# File Selection
+# Frame Sources
 # ==========================
-print(f"\nPlace your PPT/PDF/Image files inside the '{folderPath}' folder.")
-file_path = select_file()
-
-if not file_path:
-    print("No file selected. Using images from Presentation folder...")
-    slides, pathImages = load_images_from_folder(folderPath)
-    if not slides:
-        print("No images found in Presentation folder!")
-        exit()
-else:
-    file_ext = os.path.splitext(file_path)[1].lower()
-    
-    if file_ext in ['.pptx', '.ppt']:
-        print(f"Loading PPT file: {file_path}")
-        slides = convert_ppt_to_images(file_path)
-        if not slides or len(slides) == 0:
-            print("Error: Could not load PPT file or file is empty!")
-            exit()
-        pathImages = [f"Slide {i+1}" for i in range(len(slides))]
-    elif file_ext == '.pdf':
-        print(f"Loading PDF file: {file_path}")
-        slides = convert_pdf_to_images(file_path)
-        if not slides or len(slides) == 0:
-            print("Error: Could not load PDF file or file is empty!")
-            print("Note: PDF conversion requires poppler-utils. Install it from:")
-            print("https://github.com/oschwartz10612/poppler-windows/releases")
+def single_process_frames():
+    """Yield (webcam image, hands) with capture and hand tracking in this process"""
+    cap = cv2.VideoCapture(0)
+    if not cap.isOpened():
+        print("Error: Could not open webcam!")
+        return
+
+    cap.set(3, cam_width)
+    cap.set(4, cam_height)
+    detectorHand = HandDetector(detectionCon=0.8, maxHands=1)
+
+    try:
+        while True:
+            success, img = cap.read()
+            if not success:
+                print("Error: Could not read from webcam!")
+                break
+            img = cv2.flip(img, 1)
+            hands, img = detectorHand.findHands(img)  # Draws hand landmarks
+            for hand in hands:
+                hand["fingers"] = detectorHand.fingersUp(hand)
+            yield img, hands
+    finally:
+        cap.release()
+
+
+def hand_worker(ring_spec, results, stop):
+    """Hand tracking process: reads frames from the ring and sends back hands"""
+    ring = None
+    try:
+        ring = FrameRing.attach(ring_spec)
+        detectorHand = HandDetector(detectionCon=0.8, maxHands=1)
+
+        def find_hands(frame):
+            # draw=False leaves the shared frame untouched
+            hands = detectorHand.findHands(frame, draw=False)
+            for hand in hands:
+                hand["fingers"] = detectorHand.fingersUp(hand)
+            return hands
+
+        consume_latest(ring, stop, find_hands, results, "hand")
+    finally:
+        # Shut the other processes down too, also when tracking fails
+        stop.set()
+        if ring is not None:
+            ring.close()
+
+
+def draw_hand(img, hand):
+    """Lightweight landmark overlay for the webcam preview in multi-process mode"""
+    for lm in hand["lmList"]:
+        cv2.circle(img, (int(lm[0]), int(lm[1])), 5, (255, 0, 255), cv2.FILLED)
+    x, y, w, h = hand["bbox"]
+    cv2.rectangle(img, (x - 20, y - 20), (x + w + 20, y + h + 20), (255, 0, 255), 2)
+
+
+def multi_process_frames():
+    """Yield (webcam image, hands) with capture and hand tracking in worker processes"""
+    ring = FrameRing.create((cam_height, cam_width, 3), slots=ring_slots)
+    stop = multiprocessing.Event()
+    results = multiprocessing.Queue(maxsize=4)
+    workers = [
+        multiprocessing.Process(target=capture_frames, args=(ring.spec, stop),
+                                name="Webcam capture", daemon=True),
+        multiprocessing.Process(target=hand_worker, args=(ring.spec, results, stop),
+                                name="Hand tracking", daemon=True),
+    ]
+    for worker in workers:
+        worker.start()
+
+    try:
+        while not stop.is_set():
+            # One iteration per tracked frame, so gesture timing matches single-process mode
+            try:
+                record = results.get(timeout=idle_refresh_interval)
+            except queue.Empty:
+                # A worker killed outright (no finally) cannot set stop itself
+                dead = [worker.name for worker in workers if not worker.is_alive()]
+                if dead:
+                    print(f"Error: {', '.join(dead)} process stopped unexpectedly")
+                    break
+                # Tracking is starting up or stalled: keep the windows painted and
+                # the keys working by showing the newest frame with no hands
+                img = ring.copy(ring.latest())
+                if img is None:
+                    # No frame captured yet (camera still opening)
+                    img = np.zeros((cam_height, cam_width, 3), dtype=np.uint8)
+                yield img, []
+                continue
+            # If rendering fell behind, act only on the newest tracked frame
+            while True:
+                try:
+                    record = results.get_nowait()
+                except queue.Empty:
+                    break
+            _, seq, hands = record
+
+            img = ring.copy(seq)
+            if img is not None:
+                for hand in hands:
+                    draw_hand(img, hand)
+            else:
+                # Slot already reused by the capture process; show the newest frame
+                # without the overlay, since the landmarks belong to another image
+                img = ring.copy(ring.latest())
+                if img is None:
+                    continue
+            yield img, hands
+    finally:
+        stop.set()
+        for worker in workers:
+            worker.join(timeout=2)
+            if worker.is_alive():
+                worker.terminate()
+        ring.close()
+        ring.unlink()
+
+    # Reached only when the workers stopped on their own, not when the user quit
+    check_workers(workers)
+
+
+def main():
+    # ==========================
+    # Slide Display Size
+    # ==========================
+    # Probed here, not at import time, so multi-process workers do not open Tk
+    # Slide display - use fullscreen or screen resolution
+    try:
+        # Try to get screen resolution
+        root = tk.Tk()
+        screen_width = root.winfo_screenwidth()
+        screen_height = root.winfo_screenheight()
+        root.destroy()
+        slide_width = screen_width
+        slide_height = screen_height
+    except:
+        # Fallback to full HD
+        slide_width = 1920
+        slide_height = 1080
+
+    default_slide_window_width = min(slide_width, 1280)
+    default_slide_window_height = min(slide_height, 720)
+
+    # ==========================
+    # File Selection
+    # ==========================
+    print(f"\nPlace your PPT/PDF/Image files inside the '{folderPath}' folder.")
+    file_path = select_file()
+
+    if not file_path:
+        print("No file selected. Using images from Presentation folder...")
+        slides, pathImages = load_images_from_folder(folderPath)
+        if not slides:
+            print("No images found in Presentation folder!")
             exit()
-        pathImages = [f"Page {i+1}" for i in range(len(slides))]
-    elif file_ext in ['.jpg', '.jpeg', '.png', '.bmp', '.gif']:
-        print(f"Loading image file: {file_path}")
-        img = cv2.imread(file_path)
-        if img is not None:
-            slides = [img]
-            pathImages = [os.path.basename(file_path)]
+    else:
+        file_ext = os.path.splitext(file_path)[1].lower()
+    
+        if file_ext in ['.pptx', '.ppt']:
+            print(f"Loading PPT file: {file_path}")
+            slides = convert_ppt_to_images(file_path)
+            if not slides or len(slides) == 0:
+                print("Error: Could not load PPT file or file is empty!")
+                exit()
+            pathImages = [f"Slide {i+1}" for i in range(len(slides))]
+        elif file_ext == '.pdf':
+            print(f"Loading PDF file: {file_path}")
+            slides = convert_pdf_to_images(file_path)
+            if not slides or len(slides) == 0:
+                print("Error: Could not load PDF file or file is empty!")
+                print("Note: PDF conversion requires poppler-utils. Install it from:")
+                print("https://github.com/oschwartz10612/poppler-windows/releases")
+                exit()
+            pathImages = [f"Page {i+1}" for i in range(len(slides))]
+        elif file_ext in ['.jpg', '.jpeg', '.png', '.bmp', '.gif']:
+            print(f"Loading image file: {file_path}")
+            img = cv2.imread(file_path)
+            if img is not None:
+                slides = [img]
+                pathImages = [os.path.basename(file_path)]
+            else:
+                print("Error loading image file!")
+                exit()
         else:
-            print("Error loading image file!")
+            print("Unsupported file type!")
             exit()
-    else:
-        print("Unsupported file type!")
-        exit()
 
-if not slides or len(slides) == 0:
-    print("Error: No slides/pages loaded!")
-    exit()
+    if not slides or len(slides) == 0:
+        print("Error: No slides/pages loaded!")
+        exit()
 
-print(f"Total Slides/Pages: {len(slides)}")
+    print(f"Total Slides/Pages: {len(slides)}")
 
-# Prepare display windows with standard OS controls
-cv2.namedWindow("Slides", cv2.WINDOW_NORMAL)
-cv2.resizeWindow("Slides", default_slide_window_width, default_slide_window_height)
-cv2.namedWindow("Camera", cv2.WINDOW_NORMAL)
-cv2.resizeWindow("Camera", cam_display_width, cam_display_height)
+    # Prepare display windows with standard OS controls
+    cv2.namedWindow("Slides", cv2.WINDOW_NORMAL)
+    cv2.resizeWindow("Slides", default_slide_window_width, default_slide_window_height)
+    cv2.namedWindow("Camera", cv2.WINDOW_NORMAL)
+    cv2.resizeWindow("Camera", cam_display_width, cam_display_height)
 
-print("Controls: press 'f' to toggle fullscreen, 'q' to quit.")
+    print("Controls: press 'f' to toggle fullscreen, 'q' to quit.")
 
-# ==========================
-# Webcam Setup
-# ==========================
-cap = cv2.VideoCapture(0)
-if not cap.isOpened():
-    print("Error: Could not open webcam!")
-    exit()
-
-cap.set(3, cam_width)
-cap.set(4, cam_height)
+    # ==========================
+    # Webcam + Hand Detector
+    # ==========================
+    frame_source = multi_process_frames() if use_multiprocess else single_process_frames()
 
-# ==========================
-# Hand Detector
-# ==========================
-detectorHand = HandDetector(detectionCon=0.8, maxHands=1)
+    # ==========================
+    # Variables
+    # ==========================
+    imgList = []
+    delay = 30
+    buttonPressed = False
+    counter = 0
+    imgNumber = 0
+    delayCounter = 0
+    annotations = [[]]             # Stores all drawn paths
+    annotationNumber = -1
+    annotationStart = False
+    pointer_smoothing_factor = 0.35
+    smoothed_index_finger = None
+    window_fullscreen = False
 
-# ==========================
-# Variables
-# ==========================
-imgList = []
-delay = 30
-buttonPressed = False
-counter = 0
-imgNumber = 0
-delayCounter = 0
-annotations = [[]]             # Stores all drawn paths
-annotationNumber = -1
-annotationStart = False
-pointer_smoothing_factor = 0.35
-smoothed_index_finger = None
-window_fullscreen = False
+    # ==========================
+    # Main Loop
+    # ==========================
+    # 1️⃣ Get webcam image and detected hands
+    for img, hands in frame_source:
 
-# ==========================
-# Main Loop
-# ==========================
-while True:
-    # 1️⃣ Get webcam image
-    success, img = cap.read()
-    if not success:
-        print("Error: Could not read from webcam!")
-        break
-    img = cv2.flip(img, 1)
-
-    # 2️⃣ Get the current slide image - Display in FULL SIZE
-    imgCurrent = slides[imgNumber].copy()
+        # 2️⃣ Get the current slide image - Display in FULL SIZE
+        imgCurrent = slides[imgNumber].copy()
     
-    # Resize slide to fit full screen display
-    h_current, w_current = imgCurrent.shape[:2]
-    # Resize to full screen while maintaining aspect ratio
-    scale = min(slide_width / w_current, slide_height / h_current)
-    new_w = int(w_current * scale)
-    new_h = int(h_current * scale)
-    imgResized = cv2.resize(imgCurrent, (new_w, new_h))
-    
-    # Create a black background and center the image for full screen
-    background = np.zeros((slide_height, slide_width, 3), dtype=np.uint8)
-    y_offset = (slide_height - new_h) // 2
-    x_offset = (slide_width - new_w) // 2
-    background[y_offset:y_offset+new_h, x_offset:x_offset+new_w] = imgResized
-    imgCurrent = background
-
-    # 3️⃣ Find the hand and landmarks
-    hands, img = detectorHand.findHands(img)  # Draws hand landmarks
-    cv2.line(img, (0, gestureThreshold), (cam_width, gestureThreshold), (0, 255, 0), 10)
-
-    if hands and buttonPressed is False:
-        hand = hands[0]
-        cx, cy = hand["center"]
-        lmList = hand["lmList"]
-        fingers = detectorHand.fingersUp(hand)
-
-        # Interpolate index finger position for smoother drawing
-        # Get current slide dimensions for coordinate mapping
-        h_current, w_current = slides[imgNumber].shape[:2]
+        # Resize slide to fit full screen display
+        h_current, w_current = imgCurrent.shape[:2]
+        # Resize to full screen while maintaining aspect ratio
         scale = min(slide_width / w_current, slide_height / h_current)
         new_w = int(w_current * scale)
         new_h = int(h_current * scale)
-        x_offset = (slide_width - new_w) // 2
+        imgResized = cv2.resize(imgCurrent, (new_w, new_h))
+    
+        # Create a black background and center the image for full screen
+        background = np.zeros((slide_height, slide_width, 3), dtype=np.uint8)
         y_offset = (slide_height - new_h) // 2
+        x_offset = (slide_width - new_w) // 2
+        background[y_offset:y_offset+new_h, x_offset:x_offset+new_w] = imgResized
+        imgCurrent = background
+
+        # 3️⃣ Hand landmarks are already drawn on the webcam image
+        cv2.line(img, (0, gestureThreshold), (cam_width, gestureThreshold), (0, 255, 0), 10)
+
+        if hands and buttonPressed is False:
+            hand = hands[0]
+            cx, cy = hand["center"]
+            lmList = hand["lmList"]
+            fingers = hand["fingers"]
+
+            # Interpolate index finger position for smoother drawing
+            # Get current slide dimensions for coordinate mapping
+            h_current, w_current = slides[imgNumber].shape[:2]
+            scale = min(slide_width / w_current, slide_height / h_current)
+            new_w = int(w_current * scale)
+            new_h = int(h_current * scale)
+            x_offset = (slide_width - new_w) // 2
+            y_offset = (slide_height - new_h) // 2
         
-        # Map from webcam coordinates directly to the resized image area
-        xVal = int(np.interp(lmList[8][0], [0, cam_width], [0, new_w]))
-        yVal = int(np.interp(lmList[8][1], [0, cam_height], [0, new_h]))
+            # Map from webcam coordinates directly to the resized image area
+            xVal = int(np.interp(lmList[8][0], [0, cam_width], [0, new_w]))
+            yVal = int(np.interp(lmList[8][1], [0, cam_height], [0, new_h]))
         
-        # Clamp to image bounds
-        xVal = max(0, min(new_w - 1, xVal))
-        yVal = max(0, min(new_h - 1, yVal))
+            # Clamp to image bounds
+            xVal = max(0, min(new_w - 1, xVal))
+            yVal = max(0, min(new_h - 1, yVal))
         
-        # Convert to full screen coordinates (add offsets)
-        raw_index_finger = (xVal + x_offset, yVal + y_offset)
+            # Convert to full screen coordinates (add offsets)
+            raw_index_finger = (xVal + x_offset, yVal + y_offset)
 
-        if smoothed_index_finger is None:
-            smoothed_index_finger = raw_index_finger
-        else:
-            smoothed_index_finger = (
-                int(smoothed_index_finger[0] * (1 - pointer_smoothing_factor) + raw_index_finger[0] * pointer_smoothing_factor),
-                int(smoothed_index_finger[1] * (1 - pointer_smoothing_factor) + raw_index_finger[1] * pointer_smoothing_factor)
-            )
-
-        indexFinger = smoothed_index_finger
+            if smoothed_index_finger is None:
+                smoothed_index_finger = raw_index_finger
+            else:
+                smoothed_index_finger = (
+                    int(smoothed_index_finger[0] * (1 - pointer_smoothing_factor) + raw_index_finger[0] * pointer_smoothing_factor),
+                    int(smoothed_index_finger[1] * (1 - pointer_smoothing_factor) + raw_index_finger[1] * pointer_smoothing_factor)
+                )
+
+            indexFinger = smoothed_index_finger
+
+            # Draw a small pointer indicator for visual feedback
+            pointer_radius = max(6, int(slide_width / 240))
+            cv2.circle(imgCurrent, indexFinger, pointer_radius, (0, 255, 255), 2)
+
+            # ==========================
+            # Slide Navigation
+            # ==========================
+            if cy <= gestureThreshold:  # If hand is near top area
+                # 👉 Go to previous slide
+                if fingers == [1, 0, 0, 0, 0]:
+                    print("Previous Slide")
+                    buttonPressed = True
+                    if imgNumber > 0:
+                        imgNumber -= 1
+                        annotations = [[]]
+                        annotationNumber = -1
+                        annotationStart = False
+
+                # 👈 Go to next slide
+                if fingers == [0, 0, 0, 0, 1]:
+                    print("Next Slide")
+                    buttonPressed = True
+                    if imgNumber < len(slides) - 1:
+                        imgNumber += 1
+                        annotations = [[]]
+                        annotationNumber = -1
+                        annotationStart = False
+
+            # ✍️ Draw mode (index finger)
+            if fingers == [0, 1, 0, 0, 0]:
+                if annotationStart is False:
+                    annotationStart = True
+                    annotationNumber += 1
+                    annotations.append([])
+                annotations[annotationNumber].append(indexFinger)
+                # Scale circle size based on screen resolution
+                circle_size = max(10, int(slide_width / 150))
+                cv2.circle(imgCurrent, indexFinger, circle_size, (0, 0, 255), cv2.FILLED)
 
-        # Draw a small pointer indicator for visual feedback
-        pointer_radius = max(6, int(slide_width / 240))
-        cv2.circle(imgCurrent, indexFinger, pointer_radius, (0, 255, 255), 2)
+            else:
+                annotationStart = False
 
-        # ==========================
-        # Slide Navigation
-        # ==========================
-        if cy <= gestureThreshold:  # If hand is near top area
-            # 👉 Go to previous slide
-            if fingers == [1, 0, 0, 0, 0]:
-                print("Previous Slide")
-                buttonPressed = True
-                if imgNumber > 0:
-                    imgNumber -= 1
-                    annotations = [[]]
-                    annotationNumber = -1
-                    annotationStart = False
-
-            # 👈 Go to next slide
-            if fingers == [0, 0, 0, 0, 1]:
-                print("Next Slide")
-                buttonPressed = True
-                if imgNumber < len(slides) - 1:
-                    imgNumber += 1
-                    annotations = [[]]
-                    annotationNumber = -1
-                    annotationStart = False
-
-        # ✍️ Draw mode (index finger)
-        if fingers == [0, 1, 0, 0, 0]:
-            if annotationStart is False:
-                annotationStart = True
-                annotationNumber += 1
-                annotations.append([])
-            annotations[annotationNumber].append(indexFinger)
-            # Scale circle size based on screen resolution
-            circle_size = max(10, int(slide_width / 150))
-            cv2.circle(imgCurrent, indexFinger, circle_size, (0, 0, 255), cv2.FILLED)
+            # 🗑️ Erase last drawn line (index + middle + ring)
+            if fingers == [0, 1, 1, 1, 0]:
+                if annotations:
+                    annotations.pop(-1)
+                    annotationNumber -= 1
+                    buttonPressed = True
 
         else:
             annotationStart = False
+            if not hands:
+                smoothed_index_finger = None
 
-        # 🗑️ Erase last drawn line (index + middle + ring)
-        if fingers == [0, 1, 1, 1, 0]:
-            if annotations:
-                annotations.pop(-1)
-                annotationNumber -= 1
-                buttonPressed = True
+        # ==========================
+        # Delay logic to avoid multiple triggers
+        # ==========================
+        if buttonPressed:
+            counter += 1
+            if counter > delay:
+                counter = 0
+                buttonPressed = False
 
-    else:
-        annotationStart = False
-        if not hands:
-            smoothed_index_finger = None
+        # ==========================
+        # Draw annotations on current slide
+        # ==========================
+        # Scale line width based on screen resolution for better visibility
+        line_width = max(12, int(slide_width / 160))
+        for i, annotation in enumerate(annotations):
+            for j in range(len(annotation)):
+                if j != 0:
+                    cv2.line(imgCurrent, annotation[j - 1], annotation[j], (0, 0, 200), line_width)
 
-    # ==========================
-    # Delay logic to avoid multiple triggers
-    # ==========================
-    if buttonPressed:
-        counter += 1
-        if counter > delay:
-            counter = 0
-            buttonPressed = False
+        # ==========================
+        # Display
+        # ==========================
+        if window_fullscreen:
+            cv2.setWindowProperty("Slides", cv2.WND_PROP_FULLSCREEN, cv2.WINDOW_FULLSCREEN)
+        else:
+            cv2.setWindowProperty("Slides", cv2.WND_PROP_FULLSCREEN, cv2.WINDOW_NORMAL)
+        cv2.imshow("Slides", imgCurrent)
+    
+        # Display webcam in SMALL window
+        imgSmall = cv2.resize(img, (cam_display_width, cam_display_height))
+        cv2.imshow("Camera", imgSmall)
+
+        key = cv2.waitKey(1) & 0xFF
+        if key == ord('q'):
+            break
+        if key == ord('f'):
+            window_fullscreen = not window_fullscreen
+            if not window_fullscreen:
+                cv2.setWindowProperty("Slides", cv2.WND_PROP_FULLSCREEN, cv2.WINDOW_NORMAL)
+                cv2.resizeWindow("Slides", default_slide_window_width, default_slide_window_height)
 
     # ==========================
-    # Draw annotations on current slide
+    # Cleanup
     # ==========================
-    # Scale line width based on screen resolution for better visibility
-    line_width = max(12, int(slide_width / 160))
-    for i, annotation in enumerate(annotations):
-        for j in range(len(annotation)):
-            if j != 0:
-                cv2.line(imgCurrent, annotation[j - 1], annotation[j], (0, 0, 200), line_width)
+    frame_source.close()
+    cv2.destroyAllWindows()
 
-    # ==========================
-    # Display
-    # ==========================
-    if window_fullscreen:
-        cv2.setWindowProperty("Slides", cv2.WND_PROP_FULLSCREEN, cv2.WINDOW_FULLSCREEN)
-    else:
-        cv2.setWindowProperty("Slides", cv2.WND_PROP_FULLSCREEN, cv2.WINDOW_NORMAL)
-    cv2.imshow("Slides", imgCurrent)
-    
-    # Display webcam in SMALL window
-    imgSmall = cv2.resize(img, (cam_display_width, cam_display_height))
-    cv2.imshow("Camera", imgSmall)
-
-    key = cv2.waitKey(1) & 0xFF
-    if key == ord('q'):
-        break
-    if key == ord('f'):
-        window_fullscreen = not window_fullscreen
-        if not window_fullscreen:
-            cv2.setWindowProperty("Slides", cv2.WND_PROP_FULLSCREEN, cv2.WINDOW_NORMAL)
-            cv2.resizeWindow("Slides", default_slide_window_width, default_slide_window_height)
 
-# ==========================
-# Cleanup
-# ==========================
-cap.release()
-cv2.destroyAllWindows()
+if __name__ == "__main__":
+    main()
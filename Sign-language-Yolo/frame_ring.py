@@ -0,0 +1,182 @@
+import queue
+import time
+from multiprocessing import shared_memory
+
+import cv2
+import numpy as np
+
+# ==========================
+# Ring Layout
+# ==========================
+# One shared memory block holds an int64 header followed by the frame slots:
+#   header[0]      -> sequence number of the newest published frame (-1 = none yet)
+#   header[1 + i]  -> sequence number stored in slot i (WRITING while it is being filled)
+# Frame `seq` always lives in slot `seq % slots`. A single capture process writes;
+# any number of worker processes read the slots through NumPy views (no copy).
+# A reader checks the slot's sequence number again after using the view: if it
+# changed, the capture process lapped the reader and the result must be dropped.
+DEFAULT_SLOTS = 8
+WRITING = -1
+POLL_INTERVAL = 0.002  # Seconds a reader sleeps when no new frame is available
+DROP_REPORT_EVERY = 30  # Print a warning after this many dropped results
+
+
+class FrameRing:
+    """Fixed-size ring of equally shaped frames stored in shared memory"""
+
+    def __init__(self, shm, shape, slots, dtype):
+        self._shm = shm
+        self.shape = tuple(shape)
+        self.slots = slots
+        self.dtype = np.dtype(dtype)
+        self._header = np.ndarray((slots + 1,), dtype=np.int64, buffer=shm.buf)
+        self._frames = np.ndarray((slots,) + self.shape, dtype=self.dtype,
+                                  buffer=shm.buf, offset=self._header.nbytes)
+
+    @classmethod
+    def create(cls, shape, slots=DEFAULT_SLOTS, dtype=np.uint8):
+        """Allocate a new ring (call once, in the parent process)"""
+        dtype = np.dtype(dtype)
+        size = 8 * (slots + 1) + slots * int(np.prod(shape)) * dtype.itemsize
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        ring = cls(shm, shape, slots, dtype)
+        ring._header[:] = WRITING
+        return ring
+
+    @classmethod
+    def attach(cls, spec):
+        """Open an existing ring from the spec passed to a child process"""
+        name, shape, slots, dtype = spec
+        return cls(shared_memory.SharedMemory(name=name), shape, slots, dtype)
+
+    @property
+    def spec(self):
+        """Picklable description used to attach to this ring from another process"""
+        return (self._shm.name, self.shape, self.slots, self.dtype.str)
+
+    def latest(self):
+        """Sequence number of the newest published frame, or -1"""
+        return int(self._header[0])
+
+    def write(self, frame):
+        """Copy a frame into the next slot and publish it (single writer only)"""
+        seq = self.latest() + 1
+        slot = seq % self.slots
+        self._header[1 + slot] = WRITING
+        np.copyto(self._frames[slot], frame)
+        self._header[1 + slot] = seq
+        self._header[0] = seq
+        return seq
+
+    def is_current(self, seq):
+        """True while frame `seq` has not been overwritten"""
+        return seq >= 0 and int(self._header[1 + seq % self.slots]) == seq
+
+    def view(self, seq):
+        """Zero-copy view of frame `seq`, or None if it is no longer available.
+
+        Check `is_current(seq)` after using the view to detect a torn frame.
+        """
+        if not self.is_current(seq):
+            return None
+        return self._frames[seq % self.slots]
+
+    def copy(self, seq):
+        """Private copy of frame `seq` (safe to draw on), or None if overwritten"""
+        frame = self.view(seq)
+        if frame is None:
+            return None
+        frame = frame.copy()
+        return frame if self.is_current(seq) else None
+
+    def close(self):
+        self._header = None
+        self._frames = None
+        self._shm.close()
+
+    def unlink(self):
+        self._shm.unlink()
+
+
+# ==========================
+# Process Helpers
+# ==========================
+def capture_frames(ring_spec, stop, camera_index=0, mirror=True):
+    """Capture process: read the webcam and publish every frame into the ring"""
+    ring = FrameRing.attach(ring_spec)
+    height, width = ring.shape[:2]
+    cap = cv2.VideoCapture(camera_index)
+    cap.set(3, width)
+    cap.set(4, height)
+
+    try:
+        if not cap.isOpened():
+            print("Error: Cannot open camera")
+            return
+        while not stop.is_set():
+            ret, frame = cap.read()
+            if not ret:
+                print("Error: Could not read from webcam!")
+                break
+            if frame.shape != ring.shape:
+                frame = cv2.resize(frame, (width, height))
+            # Mirror while copying straight into shared memory
+            ring.write(frame[:, ::-1] if mirror else frame)
+    finally:
+        # Tell the other processes there are no more frames coming
+        stop.set()
+        cap.release()
+        ring.close()
+
+
+def consume_latest(ring, stop, handle, results, tag, prepare=None):
+    """Worker loop: run `handle` on the newest frame and queue small result records.
+
+    Frames that arrive while `handle` is busy are skipped, so a slow model
+    never builds up a backlog. Records are `(tag, seq, payload)` tuples.
+
+    `prepare` (e.g. a copy or resize) is the only step that reads the shared
+    slot; `handle` then gets its output. Use it for slow models so the slot
+    only has to survive the prepare step, not the whole inference.
+    """
+    last_seq = -1
+    dropped = 0
+    while not stop.is_set():
+        seq = ring.latest()
+        if seq == last_seq:
+            time.sleep(POLL_INTERVAL)
+            continue
+
+        frame = ring.view(seq)
+        if frame is None:
+            continue
+        if prepare is not None:
+            frame = prepare(frame)
+            torn = not ring.is_current(seq)
+            payload = None if torn else handle(frame)
+        else:
+            payload = handle(frame)
+            torn = not ring.is_current(seq)
+        del frame
+        last_seq = seq
+
+        # Slot was overwritten while we were reading it: the frame may be torn
+        if torn:
+            dropped += 1
+            if dropped % DROP_REPORT_EVERY == 0:
+                print(f"Warning: {tag} worker dropped {dropped} results (frames overwritten "
+                      f"while in use); use more ring slots or a prepare step")
+            continue
+        try:
+            results.put_nowait((tag, seq, payload))
+        except queue.Full:
+            pass
+
+
+def check_workers(workers):
+    """Raise if a worker process crashed, so multi-process mode fails as loudly
+    as single-process mode (the child's traceback is printed above this error)"""
+    for worker in workers:
+        # exitcode > 0 means an uncaught exception; < 0 is our own terminate()
+        if worker.exitcode is not None and worker.exitcode > 0:
+            raise RuntimeError(f"{worker.name} process failed (exit code {worker.exitcode})")
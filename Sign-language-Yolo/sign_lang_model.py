@@ -1,46 +1,46 @@
 import cv2
 from ultralytics import YOLO
 import mediapipe as mp
+import multiprocessing
+import queue
+
+from frame_ring import FrameRing, capture_frames, check_workers, consume_latest
 
 # ---------- YOLO SIGN MODEL ----------
 MODEL_PATH = "./best.pt"  # your trained model path
-model = YOLO(MODEL_PATH)
 
 # ---------- FACE DETECTION ----------
 mp_face = mp.solutions.face_detection
-face_detector = mp_face.FaceDetection(min_detection_confidence=0.6)
 
 # ---------- CAMERA SETUP ----------
-cap = cv2.VideoCapture(0)
-cap.set(3, 1280)
-cap.set(4, 720)
-
-print("Press 'q' to quit")
+CAM_WIDTH, CAM_HEIGHT = 1280, 720
 
-while True:
-    ret, frame = cap.read()
-    if not ret:
-        break
+# ---------- MULTI-PROCESS MODE ----------
+# Run capture, YOLO and face detection in separate processes that share
+# frames through a shared memory ring (uses several CPU cores)
+USE_MULTIPROCESS = False
+RING_SLOTS = 8
+MAX_BOX_AGE = 15  # Boxes more than this many frames older than the shown frame are hidden
 
-    # Flip for mirror view
-    frame = cv2.flip(frame, 1)
-    h, w = frame.shape[:2]
 
-    # ---------- SIGN DETECTION (YOLO) ----------
+# ---------- DETECTION ----------
+def detect_signs(model, frame):
+    """Run YOLO on a frame and return (x1, y1, x2, y2, label, conf) boxes"""
+    signs = []
     results = model.predict(frame, conf=0.5, verbose=False)
     for result in results:
         for box in result.boxes:
             x1, y1, x2, y2 = map(int, box.xyxy[0])
             conf = float(box.conf[0])
             cls = int(box.cls[0])
-            label = model.names[cls]
-            # Draw sign box
-            cv2.rectangle(frame, (x1, y1), (x2, y2), (0, 255, 255), 2)
-            cv2.putText(frame, f"{label} {conf:.2f}",
-                        (x1, y1 - 10),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 255), 2)
-
-    # ---------- FACE DETECTION (MEDIAPIPE) ----------
+            signs.append((x1, y1, x2, y2, model.names[cls], conf))
+    return signs
+
+
+def detect_faces(face_detector, frame):
+    """Run MediaPipe face detection and return (xmin, ymin, xmax, ymax, conf) boxes"""
+    h, w = frame.shape[:2]
+    faces = []
     img_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
     face_results = face_detector.process(img_rgb)
 
@@ -49,27 +49,164 @@ while True:
             bbox = det.location_data.relative_bounding_box
             xmin = int(bbox.xmin * w)
             ymin = int(bbox.ymin * h)
-            box_w = int(bbox.width * w)
-            box_h = int(bbox.height * h)
-            xmax = xmin + box_w
-            ymax = ymin + box_h
-            conf_face = det.score[0]
-
-            cv2.rectangle(frame, (xmin, ymin), (xmax, ymax), (0, 255, 0), 2)
-            cv2.putText(frame, f"Face {conf_face:.2f}",
-                        (xmin, ymin - 10),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
-
-            # (Optional) Extract face crop for emotion model
-            face_crop = frame[ymin:ymax, xmin:xmax].copy()
-            # Here you can later send face_crop to an emotion classification model
-
-    # ---------- DISPLAY ----------
-    cv2.imshow("Sign + Face Detection", frame)
-
-    key = cv2.waitKey(1) & 0xFF
-    if key == ord('q'):
-        break
-
-cap.release()
-cv2.destroyAllWindows()
\ No newline at end of file
+            xmax = xmin + int(bbox.width * w)
+            ymax = ymin + int(bbox.height * h)
+            faces.append((xmin, ymin, xmax, ymax, float(det.score[0])))
+    return faces
+
+
+# ---------- DRAWING ----------
+def draw_detections(frame, signs, faces):
+    for x1, y1, x2, y2, label, conf in signs:
+        # Draw sign box
+        cv2.rectangle(frame, (x1, y1), (x2, y2), (0, 255, 255), 2)
+        cv2.putText(frame, f"{label} {conf:.2f}",
+                    (x1, y1 - 10),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 255), 2)
+
+    for xmin, ymin, xmax, ymax, conf_face in faces:
+        cv2.rectangle(frame, (xmin, ymin), (xmax, ymax), (0, 255, 0), 2)
+        cv2.putText(frame, f"Face {conf_face:.2f}",
+                    (xmin, ymin - 10),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+
+        # (Optional) Extract face crop for emotion model
+        face_crop = frame[ymin:ymax, xmin:xmax].copy()
+        # Here you can later send face_crop to an emotion classification model
+
+
+# ---------- SINGLE PROCESS ----------
+def run_single_process():
+    model = YOLO(MODEL_PATH)
+    face_detector = mp_face.FaceDetection(min_detection_confidence=0.6)
+
+    cap = cv2.VideoCapture(0)
+    cap.set(3, CAM_WIDTH)
+    cap.set(4, CAM_HEIGHT)
+
+    print("Press 'q' to quit")
+
+    while True:
+        ret, frame = cap.read()
+        if not ret:
+            break
+
+        # Flip for mirror view
+        frame = cv2.flip(frame, 1)
+
+        # ---------- SIGN DETECTION (YOLO) + FACE DETECTION (MEDIAPIPE) ----------
+        draw_detections(frame, detect_signs(model, frame), detect_faces(face_detector, frame))
+
+        # ---------- DISPLAY ----------
+        cv2.imshow("Sign + Face Detection", frame)
+
+        key = cv2.waitKey(1) & 0xFF
+        if key == ord('q'):
+            break
+
+    cap.release()
+    cv2.destroyAllWindows()
+
+
+# ---------- MULTI PROCESS ----------
+def sign_worker(ring_spec, results, stop):
+    """YOLO process: reads frames from the ring and sends back sign boxes"""
+    ring = None
+    try:
+        ring = FrameRing.attach(ring_spec)
+        model = YOLO(MODEL_PATH)
+        # Copy first so a slow inference does not hold the shared slot
+        consume_latest(ring, stop, lambda frame: detect_signs(model, frame), results, "sign",
+                       prepare=lambda frame: frame.copy())
+    finally:
+        # Shut the other processes down too, e.g. when MODEL_PATH is missing
+        stop.set()
+        if ring is not None:
+            ring.close()
+
+
+def face_worker(ring_spec, results, stop):
+    """Face process: reads frames from the ring and sends back face boxes"""
+    ring = None
+    try:
+        ring = FrameRing.attach(ring_spec)
+        face_detector = mp_face.FaceDetection(min_detection_confidence=0.6)
+        consume_latest(ring, stop, lambda frame: detect_faces(face_detector, frame), results, "face")
+    finally:
+        stop.set()
+        if ring is not None:
+            ring.close()
+
+
+def run_multi_process():
+    ring = FrameRing.create((CAM_HEIGHT, CAM_WIDTH, 3), slots=RING_SLOTS)
+    stop = multiprocessing.Event()
+    results = multiprocessing.Queue(maxsize=16)
+    workers = [
+        multiprocessing.Process(target=capture_frames, args=(ring.spec, stop),
+                                name="Webcam capture", daemon=True),
+        multiprocessing.Process(target=sign_worker, args=(ring.spec, results, stop),
+                                name="Sign detection", daemon=True),
+        multiprocessing.Process(target=face_worker, args=(ring.spec, results, stop),
+                                name="Face detection", daemon=True),
+    ]
+    for worker in workers:
+        worker.start()
+
+    print("Press 'q' to quit")
+
+    # Latest (frame seq, boxes) from each worker. Unlike main.py, where gestures
+    # act on each tracked frame, this view is display-only: live video is shown
+    # at camera rate and boxes from a slightly older frame are drawn on it,
+    # rather than holding the video back to CPU YOLO speed. Boxes older than
+    # MAX_BOX_AGE frames (~0.5 s at 30 fps) are hidden instead of drifting.
+    detections = {"sign": (-1, []), "face": (-1, [])}
+    last_seq = -1
+    try:
+        while not stop.is_set():
+            # A worker killed outright (no finally) cannot set stop itself
+            dead = [worker.name for worker in workers if not worker.is_alive()]
+            if dead:
+                print(f"Error: {', '.join(dead)} process stopped unexpectedly")
+                break
+
+            while True:
+                try:
+                    tag, box_seq, payload = results.get_nowait()
+                except queue.Empty:
+                    break
+                detections[tag] = (box_seq, payload)
+
+            seq = ring.latest()
+            if seq != last_seq:
+                frame = ring.copy(seq)
+                if frame is not None:
+                    last_seq = seq
+                    shown = {}
+                    for tag, (box_seq, boxes) in detections.items():
+                        shown[tag] = boxes if seq - box_seq <= MAX_BOX_AGE else []
+                    draw_detections(frame, shown["sign"], shown["face"])
+                    cv2.imshow("Sign + Face Detection", frame)
+
+            key = cv2.waitKey(1) & 0xFF
+            if key == ord('q'):
+                break
+    finally:
+        stop.set()
+        for worker in workers:
+            worker.join(timeout=2)
+            if worker.is_alive():
+                worker.terminate()
+        ring.close()
+        ring.unlink()
+        cv2.destroyAllWindows()
+
+    # Same loud failure as single-process mode, e.g. when MODEL_PATH is missing
+    check_workers(workers)
+
+
+if __name__ == "__main__":
+    if USE_MULTIPROCESS:
+        run_multi_process()
+    else:
+        run_single_process()